@@ -6,6 +6,7 @@ import socket
 import asyncio
 from qasync import QThreadExecutor
 import functools
+import numpy as np
 
 
 def insort(a, x, lo=0, hi=None, key=None):
@@ -48,6 +49,16 @@ def ensure_dir_exists(path: AnyStr):
         os.makedirs(path)
 
 
+def epoch_seconds(time: np.ndarray) -> np.ndarray:
+    """Converts a datetime64 time axis to float seconds since epoch, NaT values become NaN."""
+    ns = time.astype("datetime64[ns]", copy=False).view(np.int64)
+    seconds = ns * 1e-9
+    nat = np.isnat(time)
+    if nat.any():
+        seconds[nat] = np.nan
+    return seconds
+
+
 async def background_run(function, *args, **kwargs):
     loop = asyncio.get_running_loop()
     with QThreadExecutor(1) as ex:
@@ -1,23 +1,20 @@
+import sys
+import weakref
 from typing import Tuple, Optional
 from SciQLop.backend.enums import DataOrder
 from speasy.products import SpeasyVariable
 
-providers = {}
+providers = weakref.WeakValueDictionary()
 
 
 class DataProvider:
     def __init__(self, name: str, data_order: DataOrder = DataOrder.X_FIRST, cacheable: bool = False):
         global providers
-        providers[name] = self
-        self._name = name
+        self._name = sys.intern(name)
+        providers[self._name] = self
         self._data_order = data_order
         self._cacheable = cacheable
 
-    def __del__(self):
-        global providers
-        if providers is not None:
-            providers.pop(self._name)
-
     @property
     def name(self) -> str:
         return self._name
@@ -1,7 +1,10 @@
+from functools import lru_cache
+import threading
 import numpy as np
+from datetime import datetime, timezone
 from speasy.products import SpeasyVariable, DataContainer, VariableTimeAxis, VariableAxis
 from PySide6.QtGui import QIcon
-from typing import List
+from typing import List, Optional
 from SciQLop.backend import Product
 from SciQLop.backend.unique_names import make_simple_incr_name
 from SciQLop.backend.models import products
@@ -13,22 +16,140 @@ register_icon("Python-logo-notext", QIcon(":/icons/Python-logo-notext.png"))
 
 
 def ensure_dt64(x_data):
-    if type(x_data) is np.ndarray:
-        if x_data.dtype == np.dtype("datetime64[ns]"):
-            return x_data
-        elif x_data.dtype == np.float64:
-            return (x_data * 1e9).astype("datetime64[ns]")
+    if isinstance(x_data, np.ndarray):
+        kind = x_data.dtype.kind
+        if kind == 'M':
+            return x_data.astype("datetime64[ns]", copy=False)
+        elif kind == 'f':
+            # write straight into an int64 buffer, avoids a float64 temporary the size of the time axis
+            out = np.empty(x_data.shape, dtype=np.int64)
+            with np.errstate(invalid='ignore'):
+                np.multiply(x_data, 1e9, out=out, casting='unsafe', dtype=np.float64)
+            # float to int casts of NaN are platform dependent, make them NaT explicitly
+            nan = np.isnan(x_data)
+            if nan.any():
+                out[nan] = np.iinfo(np.int64).min
+            return out.view("datetime64[ns]")
     raise ValueError(f"can't handle x axis type {type(x_data)}")
 
 
+def _to_epoch(dt: datetime) -> float:
+    return dt.replace(tzinfo=timezone.utc).timestamp()
+
+
+def _jit_compile(callback, fastmath=False):
+    try:
+        import numba
+    except ImportError:
+        raise ImportError("numba is required to build a jit compiled virtual product, please install it") from None
+    try:
+        compiled = numba.njit(cache=True, fastmath=fastmath)(callback)
+    except RuntimeError:
+        # no source file to cache against, e.g. callbacks defined with python -c or exec'd scripts
+        compiled = numba.njit(fastmath=fastmath)(callback)
+    # numba can't take datetime objects, jit compiled callbacks get start and stop as epoch seconds
+    return lambda start, stop: compiled(_to_epoch(start), _to_epoch(stop))
+
+
+def _as_c(arr):
+    if type(arr) is np.ndarray and arr.flags.c_contiguous:
+        return arr
+    return np.ascontiguousarray(arr)
+
+
+_FUSED_MIN_SIZE = 1 << 16
+# each data pipeline calls get_data from its own thread, numba's workqueue threading layer (used when neither TBB
+# nor OpenMP is available) aborts the process on concurrent parallel launches
+_kernel_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _kernels():
+    try:
+        from . import kernels
+    except ImportError:
+        return None
+    return kernels
+
+
+def _time_and_values(x, y):
+    # when y has to be copied anyway, convert x and copy y in a single parallel pass
+    if (type(x) is np.ndarray and x.dtype == np.float64 and x.ndim == 1 and len(x) >= _FUSED_MIN_SIZE
+            and type(y) is np.ndarray and y.dtype.kind in 'biuf' and y.ndim in (1, 2) and len(y) == len(x)
+            and not y.flags.c_contiguous):
+        kernels = _kernels()
+        if kernels is not None:
+            t = np.empty(x.shape, dtype=np.int64)
+            values = np.empty(y.shape, dtype=y.dtype)
+            try:
+                # compiled on first use for each dtype/layout, cached on disk afterwards
+                with _kernel_lock:
+                    if y.ndim == 1:
+                        kernels.fuse_time_values(x, y[:, np.newaxis], t, values[:, np.newaxis])
+                    else:
+                        kernels.fuse_time_values(x, y, t, values)
+                return t.view("datetime64[ns]"), values
+            except (kernels.NumbaError, ValueError):
+                # ValueError: no threading layer could be loaded
+                pass
+    return ensure_dt64(x), _as_c(y)
+
+
+_result_handlers = {
+    SpeasyVariable: lambda provider, res: res,
+    tuple: lambda provider, res: provider._from_tuple(*res),
+}
+
+
+def _no_result(provider: "EasyProvider", res):
+    return None
+
+
+def _to_variable(provider: "EasyProvider", res) -> Optional[SpeasyVariable]:
+    handler = _result_handlers.get(type(res))
+    if handler is None:
+        # subclasses such as namedtuples
+        handler = next((h for t, h in _result_handlers.items() if isinstance(res, t)), _no_result)
+    return handler(provider, res)
+
+
 class EasyProvider(DataProvider):
+    """Base class for virtual products built from a Python function.
+
+    Parameters
+    ----------
+    path: str
+        Where the product is shown in the products tree, the last element being the product name
+    callback: Callable
+        Called with the requested start and stop times as datetimes, returns either a SpeasyVariable or a tuple of
+        numpy arrays whose layout depends on the product type
+    parameter_type: ParameterType
+        Product type
+    metadata: dict
+        Extra metadata shown in the products tree
+    data_order: DataOrder
+        Memory layout of the returned values
+    cacheable: bool
+        If True, data already retrieved is reused when zooming in
+    debug: bool
+        If True, exceptions raised by the callback are printed instead of propagated
+    jit: bool
+        If True, the callback is compiled with numba.njit (numba must be installed). numba can't take datetime objects,
+        so a jit compiled callback receives start and stop as float UTC epoch seconds instead of datetimes
+    jit_fastmath: bool
+        Only used with jit, compiles the callback with fastmath. numba may then assume there are no NaN or infinite
+        values, np.isnan checks can be folded to False
+
+    """
+
     def __init__(self, path, callback, parameter_type: ParameterType, metadata: dict, data_order=DataOrder.Y_FIRST,
-                 cacheable=False, debug=False):
+                 cacheable=False, debug=False, jit=False, jit_fastmath=False):
         super(EasyProvider, self).__init__(name=make_simple_incr_name(callback.__name__), data_order=data_order,
                                            cacheable=cacheable)
         product_name = path.split('/')[-1]
         product_path = path[:-len(product_name)]
         self._path = path
+        self._columns = None
         metadata.update(
             {"description": f"Virtual {parameter_type.name} product built from Python function: {callback.__name__}"})
         products.add_product(
@@ -37,13 +158,21 @@ class EasyProvider(DataProvider):
                             parameter_type=parameter_type, metadata=metadata, icon="Python-logo-notext",
                             deletable=True), deletable_parent_nodes=True)
 
+        if jit:
+            callback = _jit_compile(callback, fastmath=jit_fastmath)
         if debug:
             self._user_get_data = lambda start, stop: self._debug_get_data(callback, start, stop)
         else:
             self._user_get_data = callback
 
+    def _from_tuple(self, x, y):
+        time, values = _time_and_values(x, y)
+        return SpeasyVariable(axes=[VariableTimeAxis(time)],
+                              values=DataContainer(values),
+                              columns=self._columns)
+
     def get_data(self, product, start, stop):
-        return self._user_get_data(start, stop)
+        return _to_variable(self, self._user_get_data(start, stop))
 
     def _debug_get_data(self, callback, start, stop):
         try:
@@ -57,74 +186,70 @@ class EasyProvider(DataProvider):
 
 
 class EasyScalar(EasyProvider):
+    """Virtual scalar product, the callback returns a (time, values) tuple where time holds either float epoch seconds
+    or datetime64 values. With jit=True the callback gets start and stop as float epoch seconds, see
+    :class:`EasyProvider` for all the other parameters.
+    """
+
     def __init__(self, path, get_data_callback, component_name: str, metadata: dict,
-                 data_order: DataOrder = DataOrder.Y_FIRST, cacheable=False, debug=False):
+                 data_order: DataOrder = DataOrder.Y_FIRST, cacheable=False, debug=False, jit=False,
+                 jit_fastmath=False):
         super(EasyScalar, self).__init__(path=path, callback=get_data_callback, parameter_type=ParameterType.SCALAR,
                                          metadata={**metadata, "components": component_name}, data_order=data_order,
-                                         cacheable=cacheable, debug=debug)
+                                         cacheable=cacheable, debug=debug, jit=jit,
+                                         jit_fastmath=jit_fastmath)
         self._columns = [component_name]
 
-    def get_data(self, product, start, stop):
-        res = self._user_get_data(start, stop)
-        if type(res) is SpeasyVariable:
-            return res
-        elif type(res) is tuple:
-            x, y = res
-            return SpeasyVariable(axes=[VariableTimeAxis(ensure_dt64(x))],
-                                  values=DataContainer(np.ascontiguousarray(y)),
-                                  columns=self._columns)
-        else:
-            return None
-
 
 class EasyVector(EasyProvider):
+    """Virtual vector product, the callback returns a (time, values) tuple where values has one column per component
+    name. With jit=True the callback gets start and stop as float epoch seconds, see :class:`EasyProvider` for all
+    the other parameters.
+    """
+
     def __init__(self, path, get_data_callback, components_names: List[str], metadata: dict,
-                 data_order: DataOrder = DataOrder.Y_FIRST, cacheable=False, debug=False):
+                 data_order: DataOrder = DataOrder.Y_FIRST, cacheable=False, debug=False, jit=False,
+                 jit_fastmath=False):
         super(EasyVector, self).__init__(path=path, callback=get_data_callback, parameter_type=ParameterType.VECTOR,
                                          metadata={**metadata, "components": ';'.join(components_names)},
-                                         data_order=data_order, cacheable=cacheable, debug=debug)
+                                         data_order=data_order, cacheable=cacheable, debug=debug, jit=jit,
+                                         jit_fastmath=jit_fastmath)
         self._columns = components_names
 
-    def get_data(self, product, start, stop):
-        res = self._user_get_data(start, stop)
-        if type(res) is SpeasyVariable:
-            return res
-        elif type(res) is tuple:
-            x, y = res
-            return SpeasyVariable(axes=[VariableTimeAxis(ensure_dt64(x))],
-                                  values=DataContainer(np.ascontiguousarray(y)),
-                                  columns=self._columns)
-        else:
-            return None
-
 
 class EasyMultiComponent(EasyVector):
+    """Same as :class:`EasyVector` for products with an arbitrary number of components."""
+
     def __init__(self, path, get_data_callback, components_names: List[str], metadata: dict,
-                 data_order: DataOrder = DataOrder.Y_FIRST, cacheable=False, debug=False):
+                 data_order: DataOrder = DataOrder.Y_FIRST, cacheable=False, debug=False, jit=False,
+                 jit_fastmath=False):
         super(EasyVector, self).__init__(path=path, callback=get_data_callback,
                                          parameter_type=ParameterType.MULTICOMPONENT,
                                          metadata={**metadata, "components": ';'.join(components_names)},
-                                         data_order=data_order, cacheable=cacheable, debug=debug)
+                                         data_order=data_order, cacheable=cacheable, debug=debug, jit=jit,
+                                         jit_fastmath=jit_fastmath)
         self._columns = components_names
 
 
 class EasySpectrogram(EasyProvider):
+    """Virtual spectrogram product, the callback returns a (time, y, values) tuple where y is the spectrogram vertical
+    axis. With jit=True the callback gets start and stop as float epoch seconds, see :class:`EasyProvider` for all
+    the other parameters.
+    """
+
     def __init__(self, path, get_data_callback, metadata: dict,
-                 data_order: DataOrder = DataOrder.Y_FIRST, cacheable=False, debug=False):
+                 data_order: DataOrder = DataOrder.Y_FIRST, cacheable=False, debug=False, jit=False,
+                 jit_fastmath=False):
         super(EasySpectrogram, self).__init__(path=path, callback=get_data_callback,
                                               parameter_type=ParameterType.SPECTROGRAM,
                                               metadata={**metadata},
                                               data_order=data_order,
                                               cacheable=cacheable,
-                                              debug=debug)
-
-    def get_data(self, product, start, stop):
-        res = self._user_get_data(start, stop)
-        if type(res) is SpeasyVariable:
-            return res
-        elif type(res) is tuple:
-            x, y, z = res
-            return SpeasyVariable(axes=[VariableTimeAxis(ensure_dt64(x)), VariableAxis(np.ascontiguousarray(y))],
-                                  values=DataContainer(np.ascontiguousarray(z)))
-        else:
-            return None
+                                              debug=debug,
+                                              jit=jit,
+                                              jit_fastmath=jit_fastmath)
+
+    def _from_tuple(self, x, y, z):
+        time, values = _time_and_values(x, z)
+        return SpeasyVariable(axes=[VariableTimeAxis(time), VariableAxis(_as_c(y))],
+                              values=DataContainer(values))
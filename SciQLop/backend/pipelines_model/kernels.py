@@ -0,0 +1,16 @@
+import numpy as np
+import numba
+from numba.core.errors import NumbaError  # noqa: F401
+
+NAT = np.iinfo(np.int64).min
+
+
+@numba.njit(parallel=True, cache=True)
+def fuse_time_values(x, y_in, t_out, y_out):
+    for i in numba.prange(x.shape[0]):
+        if np.isnan(x[i]):
+            t_out[i] = NAT
+        else:
+            t_out[i] = np.int64(x[i] * 1e9)
+        for j in range(y_in.shape[1]):
+            y_out[i, j] = y_in[i, j]
@@ -1,5 +1,5 @@
 import pickle
-from typing import Union, List, Any, Optional
+from typing import Union, List, Any, Optional, Dict
 from typing import Sequence
 
 from PySide6.QtCore import QModelIndex, QMimeData, QAbstractItemModel, QStringListModel, QPersistentModelIndex, Qt
@@ -86,6 +86,7 @@ class ProductsModel(QAbstractItemModel):
         self._mime_data = None
         self._completion_model = QStringListModel(self)
         self._root = ProductNode(name="", metadata={}, uid='root', provider="")
+        self._nodes_cache: Dict[str, ProductNode] = {}
         self._filtered_root = None
         self.set_filter("")
 
@@ -106,6 +107,7 @@ class ProductsModel(QAbstractItemModel):
                 node.parent.remove_child(node.name)
                 dirty = True
         if dirty:
+            self._nodes_cache.clear()
             self.beginResetModel()
             self._filtered_root.update(filter_regex=self._filter)
             self.endResetModel()
@@ -133,16 +135,28 @@ class ProductsModel(QAbstractItemModel):
         self.endResetModel()
         self._update_completion(products)
 
-    def add_product(self, path: str, product: ProductNode, deletable_parent_nodes: bool = False):
-        nodes_names = path.split('/')
+    def _get_or_make_path(self, path: str, deletable_parent_nodes: bool = False) -> ProductNode:
         node = self._root
-        for node_name in nodes_names:
+        prefix = ""
+        for node_name in path.split('/'):
             if node_name != '':
-                if node_name not in node:
-                    node = node.append_child(child=ProductNode(name=node_name, metadata={}, uid=node_name, provider="",
-                                                               deletable=deletable_parent_nodes))
-                else:
-                    node = node[node_name]
+                prefix = f"{prefix}/{node_name}"
+                child = self._nodes_cache.get(prefix)
+                if child is None:
+                    child = node[node_name]
+                    if child is None:
+                        child = node.append_child(child=ProductNode(name=node_name, metadata={}, uid=node_name,
+                                                                    provider="", deletable=deletable_parent_nodes))
+                    self._nodes_cache[prefix] = child
+                node = child
+        return node
+
+    def add_product(self, path: str, product: ProductNode, deletable_parent_nodes: bool = False):
+        node = self._get_or_make_path(path, deletable_parent_nodes=deletable_parent_nodes)
+        replaced = node[product.name]
+        if replaced is not None and replaced.child_count:
+            # overwriting a branch drops every cached node below it
+            self._nodes_cache.clear()
         node.merge(child=product, overwrite_leaves=True)
         self.beginResetModel()
         self._filtered_root.update(filter_regex=self._filter)
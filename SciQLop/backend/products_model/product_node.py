@@ -1,5 +1,6 @@
+import sys
 from ..common import insort
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable
 
 from ..enums import ParameterType
 
@@ -16,7 +17,7 @@ class ProductNode:
         self._metadata = metadata
         self._name = name
         self._is_param = is_parameter
-        self._provider = provider
+        self._provider = sys.intern(provider)
         self._uid = uid
         self._parameter_type = parameter_type
         self._str_content = f"name: {name}" + "\n".join([f"{key}: {value}" for key, value in metadata.items()])
@@ -51,6 +52,38 @@ class ProductNode:
             self.append_child(child)
         return child
 
+    def merge_children(self, children: Iterable['ProductNode'], overwrite_leaves=False):
+        """Merge several children into this node at once, following the same rules as :meth:`merge`.
+        Existing children are indexed once and new ones are sorted in a single pass, which is much cheaper than
+        merging them one by one when building large trees.
+
+        Parameters
+        ----------
+        children: Iterable[ProductNode]
+            The nodes to merge into this one
+        overwrite_leaves: bool
+            If True, when a child is a leaf and already exists in this node's children, it is overwritten, otherwise it
+            is ignored
+
+        """
+        existing = {child.name: child for child in self._children}
+        for child in children:
+            current = existing.get(child.name)
+            if current is None or (len(child.children) == 0 and overwrite_leaves and child is not current):
+                if current is not None:
+                    self._children.remove(current)
+                    current._parent = None
+                child.set_parent(self)
+                self._children.append(child)
+                existing[child.name] = child
+            elif current is not child:
+                sub_children = child._children
+                child._children = []
+                for sub_child in sub_children:
+                    sub_child._parent = None
+                current.merge_children(sub_children)
+        self._children.sort(key=lambda n: n.name)
+
     def append_child(self, child: 'ProductNode') -> "ProductNode":
         child.set_parent(self)
         insort(self._children, child, key=lambda n: n.name)
@@ -145,5 +178,5 @@ class ProductNode:
         if self._parent:
             parent_path = self._parent.path
             if parent_path != "":
-                return self.parent.path + "//" + self.name
+                return parent_path + "//" + self.name
         return self.name
@@ -2,10 +2,11 @@ import numpy as np
 from speasy.products import SpeasyVariable
 from scipy.interpolate import griddata
 from typing import Tuple
+from SciQLop.backend.common import epoch_seconds
 
 
 def regrid(v: SpeasyVariable) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-    t: np.ndarray = v.time.astype(np.timedelta64) / np.timedelta64(1, 's')
+    t: np.ndarray = epoch_seconds(v.time)
     resampled_t = np.linspace(t[0], t[-1], num=min(10000, len(t)), endpoint=False)
     values = v.values
     invert_y = False
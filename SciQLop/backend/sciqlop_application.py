@@ -24,16 +24,19 @@ class SciQLopApp(QApplication):
         self.load_stylesheet()
         # sciqlop_logging.setup()
         self._quickstart_shortcuts: Dict[str, Dict[str, Any]] = {}
+        self._quickstart_shortcuts_names: List[str] = []
 
     def add_quickstart_shortcut(self, name: str, description: str, icon: QtGui.QPixmap or QtGui.QIcon,
                                 callback: callable):
+        if name not in self._quickstart_shortcuts:
+            self._quickstart_shortcuts_names.append(name)
         self._quickstart_shortcuts[name] = (
             {"name": name, "description": description, "icon": icon, "callback": callback})
         self.quickstart_shortcuts_added.emit(name)
 
     @QtCore.Property(list)
     def quickstart_shortcuts(self) -> List[str]:
-        return list(self._quickstart_shortcuts.keys())
+        return self._quickstart_shortcuts_names
 
     def quickstart_shortcut(self, name: str) -> Optional[Dict[str, Any]]:
         return self._quickstart_shortcuts.get(name, None)
@@ -22,8 +22,8 @@ WORKSPACES_DIR_CONFIG_ENTRY = ConfigEntry(section="CORE", key2="WORKSPACE_DIR",
 
 def create_workspace_dir(workspace_dir: str):
     ensure_dir_exists(workspace_dir)
-    ensure_dir_exists(os.path.join(workspace_dir, "dependencies"))
-    ensure_dir_exists(os.path.join(workspace_dir, "scripts"))
+    ensure_dir_exists(f"{workspace_dir}{os.sep}dependencies")
+    ensure_dir_exists(f"{workspace_dir}{os.sep}scripts")
 
 
 class Workspace(QObject):
@@ -39,19 +39,20 @@ class Workspace(QObject):
         QObject.__init__(self, parent)
         self._mpl_backend = None
         if workspace_spec is None:
-            self._workspace_dir = str(os.path.join(WORKSPACES_DIR_CONFIG_ENTRY.get(), workspace_dir or "default"))
+            # user provided name, let os.path handle separators
+            base = str(os.path.join(WORKSPACES_DIR_CONFIG_ENTRY.get(), workspace_dir or "default"))
         else:
-            self._workspace_dir = workspace_spec.directory
-        self._dependencies_dir = str(os.path.join(self._workspace_dir, "dependencies"))
+            base = workspace_spec.directory
+        self._workspace_dir = base
+        self._dependencies_dir = f"{base}{os.sep}dependencies"
         self._ipykernel: Optional[InternalIPKernel] = None
 
-        create_workspace_dir(self._workspace_dir)
+        create_workspace_dir(base)
 
-        self._workspace_spec = workspace_spec or WorkspaceSpecFile(
-            os.path.join(self._workspace_dir, "workspace_spec.json"))
+        self._workspace_spec = workspace_spec or WorkspaceSpecFile(f"{base}{os.sep}workspace_spec.json")
         self._workspace_spec.last_used = datetime.datetime.now().isoformat()
         self.add_to_python_path(self._dependencies_dir, prepend=True, permanent=False)
-        os.chdir(self._workspace_dir)
+        os.chdir(base)
         self._ensure_all_dependencies_installed()
 
     @property
@@ -101,11 +102,12 @@ class Workspace(QObject):
 
     def _ensure_all_dependencies_installed(self):
         if len(self.dependencies):
-            with open(os.path.join(self._workspace_dir, "requirements.txt"), 'w') as f:
+            requirements_file = f"{self._workspace_dir}{os.sep}requirements.txt"
+            with open(requirements_file, 'w') as f:
                 f.write('\n'.join(self.dependencies))
 
             self._install_proc = pip_install_requirements(
-                requirements_file=os.path.join(self._workspace_dir, "requirements.txt"),
+                requirements_file=requirements_file,
                 install_dir=self._dependencies_dir, cwd=self._workspace_dir)
             self._install_proc.finished.connect(self.dependencies_installed)
             self._install_proc.start()
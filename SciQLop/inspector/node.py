@@ -46,6 +46,9 @@ class Node(QObject):
             return self._bound_id == other._bound_id
         return False
 
+    def __hash__(self) -> int:
+        return hash(self._bound_id)
+
     @property
     def selectable(self):
         return NodeCapabilities.selectable in self._capabilities
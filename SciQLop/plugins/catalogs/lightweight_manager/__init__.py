@@ -39,10 +39,26 @@ class PanelSelector(QComboBox):
         self.setSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Minimum)
 
     def update_list(self, panels):
+        current = [self.itemText(index) for index in range(1, self.count())]
+        if current == panels:
+            return
         selected = self.currentText()
-        self.clear()
-        self.addItems(["None"] + panels)
-        self.setCurrentText(selected)
+        self.blockSignals(True)
+        for index in reversed(range(len(current))):
+            if current[index] not in panels:
+                self.removeItem(index + 1)
+        for index, panel in enumerate(panels, start=1):
+            if self.itemText(index) != panel:
+                found = self.findText(panel)
+                if found > index:
+                    self.removeItem(found)
+                self.insertItem(index, panel)
+        while self.count() > len(panels) + 1:
+            self.removeItem(self.count() - 1)
+        self.setCurrentIndex(max(self.findText(selected), 0))
+        self.blockSignals(False)
+        if self.currentText() != selected:
+            self.currentTextChanged.emit(self.currentText())
 
 
 class LightweightManager(QWidget):
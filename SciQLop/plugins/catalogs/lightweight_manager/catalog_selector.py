@@ -236,17 +236,19 @@ class CatalogSelector(QTableView):
             self.catalog_selected.emit(self._selected_catalogs)
 
     def update_list(self):
-        self.model.clear()
-        self.catalogs = {c.uuid: CatalogItem(c) for c in tscat.get_catalogues()}
-        selected_catalogs = []
-        for index, catalog in enumerate(self.catalogs.values()):
-            if any(filter(lambda c: c.uuid == catalog.uuid, self._selected_catalogs)):
-                catalog.setCheckState(Qt.CheckState.Checked)
-                selected_catalogs.append(catalog)
-            self.model.setItem(index, 0, catalog)
-            self.model.setItem(index, 1, catalog.create_event_item)
-            self.model.setItem(index, 2, catalog.color_item)
-        self._selected_catalogs = selected_catalogs
+        catalogs = {c.uuid: c for c in tscat.get_catalogues()}
+        for uuid in [uuid for uuid in self.catalogs if uuid not in catalogs]:
+            self.model.removeRow(self.catalogs.pop(uuid).row())
+        for uuid, catalog in catalogs.items():
+            item = self.catalogs.get(uuid)
+            if item is None:
+                item = CatalogItem(catalog)
+                self.catalogs[uuid] = item
+                self.model.appendRow([item, item.create_event_item, item.color_item])
+            else:
+                # reloads events while keeping the row and its check state
+                item.tscat_instance = catalog
+        self._selected_catalogs = [self.catalogs[c.uuid] for c in self._selected_catalogs if c.uuid in self.catalogs]
         self.catalog_selected.emit(self._selected_catalogs)
 
     def color(self, catalog_uid):
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from PySide6.QtGui import QIcon
 import speasy as spz
 from speasy.core.inventory.indexes import ParameterIndex, ComponentIndex
@@ -31,8 +31,7 @@ def get_components(param: ParameterIndex) -> List[str] or None:
     return None
 
 
-def count_components(param: ParameterIndex):
-    labels = get_components(param)
+def _count_components(param: ParameterIndex, labels: List[str] or None):
     if labels is not None:
         return len(labels)
     if hasattr(param, "size"):
@@ -42,7 +41,11 @@ def count_components(param: ParameterIndex):
     return 0
 
 
-def data_serie_type(param: ParameterIndex):
+def count_components(param: ParameterIndex):
+    return _count_components(param, get_components(param))
+
+
+def data_serie_type(param: ParameterIndex, components_cnt: Optional[int] = None):
     if hasattr(param, "display_type"):
         display_type = param.display_type
     elif hasattr(param, "DISPLAY_TYPE"):
@@ -51,7 +54,8 @@ def data_serie_type(param: ParameterIndex):
         display_type = 'timeseries'
     else:
         display_type = None
-    components_cnt = count_components(param)
+    if components_cnt is None:
+        components_cnt = count_components(param)
     if display_type is not None or components_cnt != 0:
         if (display_type or '').lower().strip() == 'spectrogram':
             return ParameterType.SPECTROGRAM
@@ -75,22 +79,24 @@ def get_node_meta(node):
 
 
 def make_product(name, node: ParameterIndex, provider):
-    p_type = data_serie_type(node)
+    components = get_components(node)
+    p_type = data_serie_type(node, components_cnt=_count_components(node, components))
     meta = get_node_meta(node)
     meta["uid"] = node.spz_uid()
-    meta["components"] = get_components(node)
+    meta["components"] = components
     meta["provider"] = node.spz_provider()
     return Product(name, metadata=meta, is_parameter=True, provider=provider,
                    uid=f"{node.spz_provider()}/{node.spz_uid()}", parameter_type=p_type)
 
 
 def explore_nodes(inventory_node, product_node: Product, provider):
+    children = []
     for name, child in inventory_node.__dict__.items():
         if name and child:
             if hasattr(child, "name") and child.name != "AMDA":
                 name = child.name
             if isinstance(child, ParameterIndex):
-                product_node.merge(make_product(name, child, provider=provider))
+                children.append(make_product(name, child, provider=provider))
             elif hasattr(child, "__dict__"):
                 meta = {}
                 if hasattr(child, "desc"):
@@ -98,8 +104,9 @@ def explore_nodes(inventory_node, product_node: Product, provider):
                 elif hasattr(child, "description"):
                     meta = {"description": child.description}
                 cur_prod = Product(name, metadata=meta, uid=name, provider=provider)
-                product_node.merge(cur_prod)
                 explore_nodes(child, cur_prod, provider=provider)
+                children.append(cur_prod)
+    product_node.merge_children(children)
 
 
 def build_product_tree(root_node: Product, provider):
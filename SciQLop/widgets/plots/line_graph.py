@@ -8,6 +8,7 @@ from SciQLop.backend.pipelines_model.graph import Graph
 from SciQLop.backend.products_model.product_node import ProductNode
 from ...backend import sciqlop_logging
 from ...backend.enums import GraphType
+from ...backend.common import epoch_seconds
 
 log = sciqlop_logging.getLogger(__name__)
 
@@ -31,7 +32,7 @@ class LineGraph(Graph):
         if self.graph:
             if self.graph.line_count() < len(v.columns):
                 self._configure_graph(v.columns)
-            t = v.time.astype(np.timedelta64) / np.timedelta64(1, 's')
+            t = epoch_seconds(v.time)
             if v.values.dtype != np.float64:
                 self.graph.setData(t, v.values.astype(np.float64))
             else:
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, TYPE_CHECKING
 
 from PySide6.QtCore import Signal
 from PySide6.QtGui import QIcon
@@ -11,15 +11,17 @@ from ...backend import sciqlop_logging
 from ...backend.unique_names import make_simple_incr_name
 from ...backend.property import SciQLopProperty
 
-log = sciqlop_logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
-from matplotlib.backends.backend_qtagg import (
-    FigureCanvas, NavigationToolbar2QT as NavigationToolbar)
-from matplotlib.figure import Figure
+log = sciqlop_logging.getLogger(__name__)
 
 
 class MPLFigure(QFrame):
     def __init__(self, *args, parent=None, **kwargs):
+        # matplotlib and its Qt backend are only imported once an MPL figure is actually created
+        from matplotlib.backends.backend_qtagg import FigureCanvas, NavigationToolbar2QT as NavigationToolbar
+        from matplotlib.figure import Figure
         QFrame.__init__(self, parent=parent)
         self.setObjectName(make_simple_incr_name(base="MPLPlot"))
         self._parent_node = None
@@ -46,8 +48,8 @@ class MPLFigure(QFrame):
     def delete_node(self):
         self.close()
 
-    @SciQLopProperty(Figure)
-    def mpl_figure(self):
+    @SciQLopProperty(object)
+    def mpl_figure(self) -> "Figure":
         return self._canvas.figure
 
     def refresh(self):
@@ -115,9 +117,5 @@ class MPLPanel(QScrollArea, PlotPanel, metaclass=MetaPlotPanel):
     def figures(self) -> List[MPLFigure]:
         return self._plot_container.plots
 
-    def __del__(self):
-        log.debug("deleting MPLPanel")
-
     def __getitem__(self, index: int) -> MPLFigure:
-        plots: List[MPLFigure] = filter(lambda w: isinstance(w, MPLFigure), self._plot_container.plots)
-        return list(plots)[index]
+        return self._plot_container.plots[index]
@@ -7,7 +7,6 @@ from SciQLopPlots import SciQLopPlot, QCustomPlot, QCP, QCPAxisTickerDateTime, Q
     QCPAbstractLegendItem, \
     QCPMarginGroup, \
     QCPColorScale, SciQLopGraph
-from seaborn import color_palette
 
 from SciQLop.backend.models import products
 from SciQLop.backend.pipelines_model.data_provider import DataProvider
@@ -78,6 +77,7 @@ class TimeSeriesPlot(QFrame):
                                            DropHandler(mime_type=TIME_RANGE_MIME_TYPE,
                                                        callback=self._set_time_range)])
 
+        from seaborn import color_palette
         self._palette = color_palette()
         self._palette_index = 0
         _configure_plot(self._plot)
@@ -208,12 +208,17 @@ class TimeSeriesPlot(QFrame):
         if type(product) is str:
             product = products.product(product)
         if product:
+            provider = providers.get(product.provider)
+            if provider is None:
+                # providers are only weakly referenced, the one behind this product may have been collected
+                log.warning(f"Can't plot {product.name}, its provider {product.provider} no longer exists")
+                return
             if product.parameter_type in (ParameterType.VECTOR, ParameterType.MULTICOMPONENT, ParameterType.SCALAR):
-                self._add_multi_line_graph(providers[product.provider], product,
+                self._add_multi_line_graph(provider, product,
                                            components=product.metadata.get('components') or [
                                                product.name])
             elif product.parameter_type == ParameterType.SPECTROGRAM and not self.has_colormap:
-                self._add_colormap_graph(providers[product.provider], product)
+                self._add_colormap_graph(provider, product)
             self.graph_list_changed.emit()
 
     def _register_new_graph(self, graph: Graph):
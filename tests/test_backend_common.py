@@ -1,4 +1,6 @@
-from SciQLop.backend.common import insort
+import numpy as np
+
+from SciQLop.backend.common import insort, epoch_seconds
 
 
 def test_insort():
@@ -13,3 +15,18 @@ def test_insort():
     assert l == [0, 1, 3, 4, 5, 7, 9, 10, 10]
     insort(l, 0)
     assert l == [0, 0, 1, 3, 4, 5, 7, 9, 10, 10]
+
+
+def test_epoch_seconds():
+    t = np.array(["1970-01-01T00:00:01", "NaT", "2020-01-01T00:00:00.5"], dtype="datetime64[ns]")
+    s = epoch_seconds(t)
+    assert s[0] == 1.
+    assert np.isnan(s[1])
+    assert s[2] == 1577836800.5
+
+
+def test_epoch_seconds_from_non_ns_datetime64():
+    t = np.array(["1970-01-01T00:00:02", "NaT"], dtype="datetime64[s]")
+    s = epoch_seconds(t)
+    assert s[0] == 2.
+    assert np.isnan(s[1])
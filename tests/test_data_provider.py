@@ -0,0 +1,11 @@
+import gc
+
+from SciQLop.backend.pipelines_model.data_provider import DataProvider, providers
+
+
+def test_providers_are_weakly_referenced():
+    provider = DataProvider(name="test_weak_provider")
+    assert providers.get("test_weak_provider") is provider
+    del provider
+    gc.collect()
+    assert providers.get("test_weak_provider") is None
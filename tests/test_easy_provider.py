@@ -0,0 +1,169 @@
+import os
+import subprocess
+import sys
+from collections import namedtuple
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from SciQLop.backend.pipelines_model import easy_provider
+from SciQLop.backend.pipelines_model.easy_provider import ensure_dt64, EasyScalar, EasySpectrogram
+
+
+def test_ensure_dt64_from_float64():
+    t = ensure_dt64(np.array([0., 1.5, 1e9]))
+    assert t.dtype == np.dtype("datetime64[ns]")
+    assert np.array_equal(t, np.array([0, 1_500_000_000, 1_000_000_000_000_000_000], dtype="datetime64[ns]"))
+
+
+def test_ensure_dt64_from_float32():
+    t = ensure_dt64(np.array([0., 2.], dtype=np.float32))
+    assert t.dtype == np.dtype("datetime64[ns]")
+    assert np.array_equal(t, np.array([0, 2_000_000_000], dtype="datetime64[ns]"))
+
+
+def test_ensure_dt64_nan_is_nat():
+    t = ensure_dt64(np.array([1., np.nan, 3.]))
+    assert np.array_equal(np.isnat(t), [False, True, False])
+    assert t[2] == np.datetime64(3_000_000_000, "ns")
+
+
+def test_ensure_dt64_from_non_ns_datetime64():
+    t = ensure_dt64(np.array(["2020-01-01T00:00:00", "2020-01-01T00:00:01"], dtype="datetime64[s]"))
+    assert t.dtype == np.dtype("datetime64[ns]")
+    assert t[1] == np.datetime64("2020-01-01T00:00:01", "ns")
+
+
+_TimeSerie = namedtuple("_TimeSerie", ["x", "y"])
+
+
+def test_callback_can_return_a_tuple_subclass():
+    provider = EasyScalar(path="tests/namedtuple_scalar",
+                          get_data_callback=lambda start, stop: _TimeSerie(np.array([0., 1.]), np.array([1., 2.])),
+                          component_name="v", metadata={})
+    v = provider.get_data(None, datetime(2020, 1, 1), datetime(2020, 1, 2))
+    assert v is not None
+    assert np.array_equal(v.values.ravel(), [1., 2.])
+
+
+def _jit_scalar(start, stop):
+    x = np.arange(start, stop, 1.)
+    y = np.cos(x)
+    y[::2] = np.nan
+    return x, np.where(np.isnan(y), 0., y)
+
+
+def test_jit_callback_gets_epoch_seconds():
+    pytest.importorskip("numba")
+    provider = EasyScalar(path="tests/jit_scalar", get_data_callback=_jit_scalar, component_name="v", metadata={},
+                          jit=True)
+    v = provider.get_data(None, datetime(2020, 1, 1), datetime(2020, 1, 1, 0, 0, 10))
+    assert len(v) == 10
+    assert v.time[0] == np.datetime64("2020-01-01T00:00:00", "ns")
+    # fastmath is off by default, NaN masking must survive compilation
+    assert not np.any(np.isnan(v.values))
+    assert np.all(v.values[::2] == 0.)
+
+
+def test_jit_callback_without_source_file():
+    pytest.importorskip("numba")
+    namespace = {"np": np}
+    exec(compile("def f(start, stop):\n    x = np.arange(start, stop, 1.)\n    return x, x * 2.\n", "<string>",
+                 "exec"), namespace)
+    provider = EasyScalar(path="tests/jit_exec_scalar", get_data_callback=namespace["f"], component_name="v",
+                          metadata={}, jit=True)
+    v = provider.get_data(None, datetime(2020, 1, 1), datetime(2020, 1, 1, 0, 0, 10))
+    assert len(v) == 10
+    assert v.time[0] == np.datetime64("2020-01-01T00:00:00", "ns")
+
+
+def test_spectrogram_values_are_contiguous_and_not_shared():
+    z = np.arange(40.).reshape(10, 4)
+    results = {"z": z[:, ::2]}
+    provider = EasySpectrogram(path="tests/spectrogram",
+                               get_data_callback=lambda start, stop: (np.arange(10.), np.arange(2.), results["z"]),
+                               metadata={})
+    first = provider.get_data(None, datetime(2020, 1, 1), datetime(2020, 1, 2))
+    second = provider.get_data(None, datetime(2020, 1, 1), datetime(2020, 1, 2))
+    assert first.values.flags.c_contiguous
+    assert np.array_equal(first.values, z[:, ::2])
+    assert not np.shares_memory(first.values, second.values)
+    # contiguous values are passed through without copy
+    results["z"] = z
+    assert np.shares_memory(provider.get_data(None, datetime(2020, 1, 1), datetime(2020, 1, 2)).values, z)
+
+
+@pytest.mark.parametrize("y", [np.arange(200.).reshape(20, 10)[:, ::3],
+                               np.arange(40, dtype=np.int32)[::2],
+                               np.arange(40, dtype=np.float32).reshape(20, 2).T.copy().T])
+def test_fused_time_values_match_unfused_path(monkeypatch, y):
+    pytest.importorskip("numba")
+    monkeypatch.setattr(easy_provider, "_FUSED_MIN_SIZE", 1)
+    x = np.arange(20.) * 1.5
+    x[3] = np.nan
+    assert not y.flags.c_contiguous
+    t, values = easy_provider._time_and_values(x, y)
+    assert np.array_equal(t, ensure_dt64(x), equal_nan=True)
+    assert np.isnat(t[3])
+    assert values.flags.c_contiguous
+    assert values.dtype == y.dtype
+    assert np.array_equal(values, y)
+
+
+def test_spectrogram_uses_fused_time_values(monkeypatch):
+    pytest.importorskip("numba")
+    monkeypatch.setattr(easy_provider, "_FUSED_MIN_SIZE", 1)
+    x = np.arange(10.)
+    x[2] = np.nan
+    z = np.arange(60.).reshape(10, 6)[:, ::2]
+    provider = EasySpectrogram(path="tests/fused_spectrogram",
+                               get_data_callback=lambda start, stop: (x, np.arange(3.), z), metadata={})
+    v = provider.get_data(None, datetime(2020, 1, 1), datetime(2020, 1, 2))
+    assert np.array_equal(v.time, ensure_dt64(x), equal_nan=True)
+    assert v.values.flags.c_contiguous
+    assert np.array_equal(v.values, z)
+
+
+def test_fused_time_values_falls_back_for_object_arrays(monkeypatch):
+    monkeypatch.setattr(easy_provider, "_FUSED_MIN_SIZE", 1)
+    x = np.arange(10.)
+    y = np.array([object()] * 20, dtype=object)[::2]
+    t, values = easy_provider._time_and_values(x, y)
+    assert np.array_equal(t, ensure_dt64(x))
+    assert values.flags.c_contiguous
+    assert all(a is b for a, b in zip(values, y))
+
+
+_CONCURRENT_FUSE = """
+import threading
+import numpy as np
+from SciQLop.backend.pipelines_model import easy_provider
+
+x = np.arange(1 << 21) * 1.
+y = np.arange(1 << 22, dtype=np.float64).reshape(-1, 2)[:, ::2]
+errors = []
+
+def run():
+    try:
+        for _ in range(5):
+            t, values = easy_provider._time_and_values(x, y)
+            assert np.array_equal(values, y)
+    except Exception as e:
+        errors.append(e)
+
+threads = [threading.Thread(target=run) for _ in range(4)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+assert not errors, errors
+"""
+
+
+def test_fused_time_values_from_concurrent_threads():
+    pytest.importorskip("numba")
+    # workqueue is the only threading layer always available and it aborts the process on concurrent use
+    res = subprocess.run([sys.executable, "-c", _CONCURRENT_FUSE], capture_output=True, text=True, timeout=600,
+                         env={**os.environ, "NUMBA_THREADING_LAYER": "workqueue"})
+    assert res.returncode == 0, res.stderr
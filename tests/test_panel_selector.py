@@ -0,0 +1,40 @@
+import random
+
+from SciQLop.plugins.catalogs.lightweight_manager import PanelSelector
+
+
+def _items(selector: PanelSelector):
+    return [selector.itemText(index) for index in range(selector.count())]
+
+
+def test_update_list_keeps_selection(qapp):
+    selector = PanelSelector()
+    selector.update_list(["Panel0", "Panel1", "Panel2"])
+    selector.setCurrentText("Panel1")
+    changes = []
+    selector.panel_selection_changed.connect(changes.append)
+    selector.update_list(["Panel1", "Panel3", "Panel0"])
+    assert _items(selector) == ["None", "Panel1", "Panel3", "Panel0"]
+    assert selector.currentText() == "Panel1"
+    assert changes == []
+
+
+def test_update_list_falls_back_to_none_when_selection_disappears(qapp):
+    selector = PanelSelector()
+    selector.update_list(["Panel0", "Panel1"])
+    selector.setCurrentText("Panel1")
+    changes = []
+    selector.panel_selection_changed.connect(changes.append)
+    selector.update_list(["Panel0"])
+    assert _items(selector) == ["None", "Panel0"]
+    assert changes == ["None"]
+
+
+def test_update_list_matches_random_changes(qapp):
+    rng = random.Random(42)
+    names = [f"Panel{i}" for i in range(8)]
+    selector = PanelSelector()
+    for _ in range(200):
+        panels = rng.sample(names, rng.randint(0, len(names)))
+        selector.update_list(panels)
+        assert _items(selector) == ["None"] + panels
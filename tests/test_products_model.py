@@ -11,3 +11,26 @@ def test_add_nodes():
                                 product=Product(name="test", metadata={}, provider="test", uid="test3"))
     assert models.products.product("test/node/test") is not None
     assert models.products.product("test/node/test").uid == "test3"
+
+
+def test_add_nodes_sharing_a_prefix():
+    models.products.add_product(path="prefix/node",
+                                product=Product(name="a", metadata={}, provider="test", uid="a"))
+    models.products.add_product(path="prefix/node/",
+                                product=Product(name="b", metadata={}, provider="test", uid="b"))
+    assert models.products.product("prefix/node/a").uid == "a"
+    assert models.products.product("prefix/node/b").uid == "b"
+    assert len(models.products.product("prefix").children) == 1
+
+
+def test_merge_children():
+    root = Product(name="root", metadata={}, provider="test", uid="root")
+    root.merge(Product(name="b", metadata={}, provider="test", uid="b"))
+    branch = Product(name="b", metadata={}, provider="test", uid="b2")
+    branch.append_child(Product(name="leaf", metadata={}, provider="test", uid="leaf"))
+    root.merge_children([Product(name="c", metadata={}, provider="test", uid="c"),
+                         Product(name="a", metadata={}, provider="test", uid="a"),
+                         branch])
+    assert [child.name for child in root.children] == ["a", "b", "c"]
+    assert root["b"].uid == "b"
+    assert root["b"]["leaf"].parent is root["b"]
@@ -0,0 +1,33 @@
+import os
+import shutil
+import stat
+from types import SimpleNamespace
+
+import pytest
+
+from SciQLop.backend.workspace.workspace import Workspace
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    f = src_dir / "data.txt"
+    f.write_text("some data")
+    os.chmod(f, 0o750)
+    return f
+
+
+def test_add_files_copies_content_and_mode(tmp_path, source_file):
+    ws_dir = tmp_path / "workspace"
+    ws_dir.mkdir()
+    Workspace.add_files(SimpleNamespace(_workspace_dir=str(ws_dir)), [str(source_file)])
+    copied = ws_dir / source_file.name
+    assert copied.read_text() == "some data"
+    assert stat.S_IMODE(os.stat(copied).st_mode) == stat.S_IMODE(os.stat(source_file).st_mode)
+
+
+def test_add_files_into_its_own_directory_keeps_the_file(source_file):
+    with pytest.raises(shutil.SameFileError):
+        Workspace.add_files(SimpleNamespace(_workspace_dir=str(source_file.parent)), [str(source_file)])
+    assert source_file.read_text() == "some data"